@@ -4,17 +4,131 @@ JSON to Tabular Converter
 A Python script to convert JSON files into tabular format and display them as tables.
 """
 
+from __future__ import annotations
+
 import json
-import pandas as pd
-from tabulate import tabulate
-import argparse
+import functools
+import mmap
+import os
 import sys
 from pathlib import Path
-from typing import Union, Dict, List, Any
-import flatten_json
+from typing import Union, Dict, List, Any, Optional
+from collections import Counter, deque
+from types import MappingProxyType
 import re
 from datetime import datetime
-import yaml
+
+# pandas, numpy, tabulate and yaml are imported lazily inside the functions
+# that need them, so --help and the usage banner don't pay their import cost
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.json as pa_json
+except ImportError:
+    pa = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+def _intern_pairs(pairs):
+    """dict hook that interns keys, so the field names repeated across
+    thousands of records share one str object instead of one each."""
+    return {sys.intern(k): v for k, v in pairs}
+
+# Fastest available JSON parse entry point, chosen once at import; orjson
+# caches short keys natively and raises json.JSONDecodeError subclasses,
+# so error handling is shared
+if orjson is not None:
+    _loads = orjson.loads
+else:
+    def _loads(data):
+        return json.loads(data, object_pairs_hook=_intern_pairs)
+
+# Inputs larger than this are streamed record-by-record when possible
+_STREAM_THRESHOLD = 32 * 1024 * 1024
+
+# Files larger than this are mmap'd for parsing instead of copied into a
+# bytes object; below it the mapping setup outweighs the saved copy
+_MMAP_THRESHOLD = 256 * 1024
+
+# Record lists at least this long are flattened across worker processes
+_PARALLEL_THRESHOLD = 50_000
+# Records above which schema accumulation is split across processes
+_SCHEMA_PARALLEL_THRESHOLD = 4096
+
+# Indentation prefixes are reused constantly while walking trees; index by
+# depth instead of rebuilding "  " * indent per node
+_PREFIXES = tuple("  " * i for i in range(64))
+
+# Display names for the types JSON can produce; a dict hit is cheaper than
+# chasing type(x).__name__ through two attribute lookups per node
+_TYPE_NAMES = {
+    dict: "dict", list: "list", str: "str", int: "int",
+    float: "float", bool: "bool", type(None): "NoneType",
+}
+
+# Matches the ANSI codes colorize() emits, for measuring visible width
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+# Precompiled patterns for per-cell value highlighting
+_DATE_RE = re.compile(r'\d{1,2}/\d{1,2}/\d{4}')
+_ID_RE = re.compile(r'^[A-Z0-9_-]+$')
+
+# Patterns tried in order by detect_field_pattern for string values, paired
+# with the schema template each one maps to. Templates are copied before the
+# per-value example is attached.
+_DATETIME_RE = re.compile(r'^\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}:\d{2}$')
+_DATE_ONLY_RE = re.compile(r'^\d{1,2}/\d{1,2}/\d{4}$')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_NUMERIC_RE = re.compile(r'^[0-9]+$')
+_STR_TEMPLATES = {
+    "datetime": {
+        "type": "string",
+        "format": "datetime",
+        "pattern": _DATETIME_RE.pattern,
+        "description": "Date and time in MM/DD/YYYY HH:MM:SS format",
+    },
+    "dateonly": {
+        "type": "string",
+        "format": "date",
+        "pattern": _DATE_ONLY_RE.pattern,
+        "description": "Date in MM/DD/YYYY format",
+    },
+    "email": {
+        "type": "string",
+        "format": "email",
+        "pattern": _EMAIL_RE.pattern,
+        "description": "Email address",
+    },
+    "ident": {
+        "type": "string",
+        "pattern": _ID_RE.pattern,
+        "description": "Identifier or key",
+    },
+    "numeric": {
+        "type": "string",
+        "pattern": _NUMERIC_RE.pattern,
+        "description": "Numeric string",
+    },
+}
+# All string patterns fused into one alternation: a single match() walks
+# the branches in ladder order and m.lastgroup names the winner
+_STR_PATTERN_RE = re.compile("^(?:" + "|".join(
+    f"(?P<{name}>{globals()[rx].pattern[1:-1]})" for name, rx in [
+        ("datetime", "_DATETIME_RE"),
+        ("dateonly", "_DATE_ONLY_RE"),
+        ("email", "_EMAIL_RE"),
+        ("ident", "_ID_RE"),
+        ("numeric", "_NUMERIC_RE"),
+    ]) + ")$")
 
 # Color codes for terminal output
 class Colors:
@@ -36,16 +150,30 @@ class Colors:
     BG_RED = '\033[41m'
     BG_GRAY = '\033[100m'
 
+# Probed once at import; colorize() is called per cell, so it reads this
+# cached bool instead of repeating the isatty syscall and environ lookup
+_COLOR_SUPPORTED = (hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()
+                    and os.environ.get('TERM') != 'dumb')
+
 def is_color_supported() -> bool:
-    """Check if terminal supports color output."""
-    import os
-    return hasattr(sys.stdout, 'isatty') and sys.stdout.isatty() and os.environ.get('TERM') != 'dumb'
+    """Check if terminal supports color output (probed once at import)."""
+    return _COLOR_SUPPORTED
+
+@functools.lru_cache(maxsize=256)
+def _wrap_color(text: str, color: str) -> str:
+    """Wrap text in a color code; cached for repeated banners/separators."""
+    return f"{color}{text}{Colors.END}"
 
 def colorize(text: str, color: str, enabled: bool = True) -> str:
     """Add color to text if color output is enabled."""
-    if not enabled or not is_color_supported():
+    if not enabled or not _COLOR_SUPPORTED:
         return text
-    return f"{color}{text}{Colors.END}"
+    return _wrap_color(text, color)
+
+# Separator lines used by every display function; built once instead of
+# repeating "=" * n at each call site
+_SEP_50 = "=" * 50
+_SEP_60 = "=" * 60
 
 def highlight_value(value: Any, enabled: bool = True) -> str:
     """Highlight different types of values with colors."""
@@ -53,63 +181,82 @@ def highlight_value(value: Any, enabled: bool = True) -> str:
         return str(value)
     
     value_str = str(value)
-    
+
     # Numbers
     if isinstance(value, (int, float)):
         return colorize(value_str, Colors.CYAN)
-    
+
+    # Non-strings can't match the regex patterns; skip straight to the
+    # empty/default handling
+    if not isinstance(value, str):
+        if value_str in ['', 'null', 'None']:
+            return colorize(value_str, Colors.RED)
+        return colorize(value_str, Colors.BLUE)
+
     # Strings that look like dates
-    if isinstance(value, str) and re.match(r'\d{1,2}/\d{1,2}/\d{4}', value_str):
+    if _DATE_RE.match(value_str):
         return colorize(value_str, Colors.YELLOW)
-    
+
     # Strings that look like keys/IDs
-    if isinstance(value, str) and re.match(r'^[A-Z0-9_-]+$', value_str):
+    if _ID_RE.match(value_str):
         return colorize(value_str, Colors.GREEN)
-    
+
     # Empty values
     if value_str in ['', 'null', 'None']:
         return colorize(value_str, Colors.RED)
-    
+
     # Default string color
     return colorize(value_str, Colors.BLUE)
 
-def colorize_table(table_str: str, enabled: bool = True) -> str:
-    """Add colors to table output."""
-    if not enabled:
-        return table_str
-    
-    lines = table_str.split('\n')
-    colored_lines = []
-    
-    for i, line in enumerate(lines):
-        if i == 0:  # Header
-            colored_lines.append(colorize(line, Colors.BOLD + Colors.BG_GRAY))
-        elif '|' in line and not line.startswith('+') and not line.startswith('='):
-            # Data rows - colorize values
-            parts = line.split('|')
-            colored_parts = []
-            for j, part in enumerate(parts):
-                if j == 0:  # Index column
-                    colored_parts.append(colorize(part.strip(), Colors.YELLOW))
-                else:
-                    # Try to extract and colorize the value
-                    value = part.strip()
-                    if value and not value.startswith('-'):
-                        colored_parts.append(highlight_value(value))
-                    else:
-                        colored_parts.append(part)
-            colored_lines.append('|'.join(colored_parts))
-        else:
-            # Separator lines
-            colored_lines.append(colorize(line, Colors.GRAY if hasattr(Colors, 'GRAY') else ''))
-    
-    return '\n'.join(colored_lines)
+def _colorize_cells(df: pd.DataFrame) -> pd.DataFrame:
+    """Color a display DataFrame with the highlight_value scheme, vectorized.
+
+    Instead of calling highlight_value per cell, classify each column in
+    bulk: numeric columns are wrapped in cyan wholesale, string columns get
+    one C-level regex pass per pattern and an np.select over the masks.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if not is_color_supported():
+        # Mirror colorize(): no ANSI codes when stdout can't render them
+        return df
+
+    end = Colors.END
+    colored = df.copy(deep=False)
+    for col in colored.columns:
+        s = colored[col]
+        if pd.api.types.is_numeric_dtype(s):
+            colored[col] = Colors.CYAN + s.astype(str) + end
+            continue
+        strs = s.astype(str)
+        colored[col] = np.select(
+            [strs.str.match(_DATE_RE), strs.str.match(_ID_RE),
+             strs.isin(['', 'null', 'None'])],
+            [Colors.YELLOW + strs + end, Colors.GREEN + strs + end,
+             Colors.RED + strs + end],
+            default=Colors.BLUE + strs + end,
+        )
+    return colored
 
 def load_json_file(file_path: str) -> Union[Dict, List]:
     """Load and parse JSON file."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
+        # buffering=0 skips the BufferedReader copy; we do one bulk read
+        with open(file_path, 'rb', buffering=0) as file:
+            if (orjson is not None and
+                    os.fstat(file.fileno()).st_size > _MMAP_THRESHOLD):
+                # Parse straight out of the page cache; no full-size bytes
+                # copy. Only orjson accepts a buffer view - stdlib json
+                # would need the copy anyway.
+                mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    return orjson.loads(memoryview(mm))
+                finally:
+                    mm.close()
+            raw = file.read()
+        # _loads parses UTF-8 bytes directly, skipping the text-decode pass
+        data = _loads(raw)
         return data
     except FileNotFoundError:
         print(f"Error: File '{file_path}' not found.")
@@ -121,43 +268,282 @@ def load_json_file(file_path: str) -> Union[Dict, List]:
         print(f"Error reading file: {e}")
         sys.exit(1)
 
+def load_ndjson_file(file_path: str) -> List[Dict]:
+    """Load a newline-delimited JSON file (one record per line).
+
+    pyarrow's block reader parses NDJSON with multiple threads when the
+    library is present; otherwise each line is parsed individually.
+    """
+    try:
+        if pa is not None:
+            return pa_json.read_json(file_path).to_pylist()
+        records = []
+        with open(file_path, 'rb') as file:
+            for line in file:
+                if line.strip():
+                    records.append(_loads(line))
+        return records
+    except FileNotFoundError:
+        print(f"Error: File '{file_path}' not found.")
+        sys.exit(1)
+    except json.JSONDecodeError as e:
+        print(f"Error: Invalid JSON format - {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error reading file: {e}")
+        sys.exit(1)
+
+def _is_top_level_array(file_path: str) -> bool:
+    """Check whether the file's first non-whitespace byte opens an array."""
+    with open(file_path, 'rb') as file:
+        while True:
+            chunk = file.read(64)
+            if not chunk:
+                return False
+            stripped = chunk.lstrip()
+            if stripped:
+                return stripped[:1] == b'['
+
+def load_json_stream(file_path: str):
+    """Yield top-level array items one at a time without building the full tree.
+
+    Requires ijson; only valid for files whose top level is a JSON array
+    (the common tabular case). Peak memory stays at one record plus the
+    flattened rows instead of the whole decoded document.
+    """
+    if ijson is None:
+        print("Error: streaming mode requires the 'ijson' package.")
+        sys.exit(1)
+    with open(file_path, 'rb') as file:
+        # use_float keeps numbers as float, matching json/orjson parsing
+        yield from ijson.items(file, 'item', use_float=True)
+
+def _flatten(obj: Any, sep: str = '_') -> Dict[str, Any]:
+    """Flatten a nested dict/list into a single-level dict, iteratively.
+
+    Keys are joined with `sep` (e.g. {'a': {'b': 1}} -> {'a_b': 1}), with list
+    items keyed by index. An explicit stack replaces recursion, so deeply
+    nested structures don't hit the recursion limit or pay per-level call
+    frames. Empty dicts/lists are kept as leaf values.
+    """
+    if isinstance(obj, dict) and not obj:
+        return {}
+    flat: Dict[str, Any] = {}
+    stack = deque([("", obj)])
+    while stack:
+        prefix, value = stack.pop()
+        if isinstance(value, dict) and value:
+            # Push in reverse so pop() yields keys in original order
+            for key in reversed(value.keys()):
+                stack.append((f"{prefix}{sep}{key}" if prefix else str(key), value[key]))
+        elif isinstance(value, list) and value:
+            for i in range(len(value) - 1, -1, -1):
+                stack.append((f"{prefix}{sep}{i}" if prefix else str(i), value[i]))
+        else:
+            flat[prefix] = value
+    return flat
+
+def _make_extractor(template: Dict):
+    """Build a flattener specialized to `template`'s nested shape.
+
+    Record lists usually share one schema, so instead of re-deriving every
+    path string per record, capture the leaf paths of the first record once
+    and pull them out of subsequent records by direct indexing. Returns a
+    callable that produces the flattened dict, or None when a record's
+    shape diverges from the template (caller falls back to _flatten).
+    """
+    paths = []
+    # Expected shape of every nested container: key tuple for dicts, length
+    # for lists. extract() re-checks these so a record that grew extra
+    # nested fields falls back to _flatten instead of silently losing them.
+    shapes = []
+    stack = [("", (), template)]
+    while stack:
+        prefix, path, value = stack.pop()
+        if isinstance(value, dict) and value:
+            if path:
+                shapes.append((path, tuple(value.keys())))
+            for key in reversed(value.keys()):
+                stack.append((f"{prefix}_{key}" if prefix else str(key), path + (key,), value[key]))
+        elif isinstance(value, list) and value:
+            shapes.append((path, len(value)))
+            for i in range(len(value) - 1, -1, -1):
+                stack.append((f"{prefix}_{i}" if prefix else str(i), path + (i,), value[i]))
+        else:
+            paths.append((prefix, path))
+    top_keys = tuple(template.keys())
+
+    def extract(record):
+        if tuple(record.keys()) != top_keys:
+            return None
+        flat = {}
+        try:
+            for path, expected in shapes:
+                node = record
+                for seg in path:
+                    node = node[seg]
+                if type(expected) is int:
+                    if not isinstance(node, list) or len(node) != expected:
+                        return None
+                elif not isinstance(node, dict) or tuple(node.keys()) != expected:
+                    return None
+            for flat_key, path in paths:
+                value = record
+                for seg in path:
+                    value = value[seg]
+                if isinstance(value, (dict, list)) and value:
+                    # Nested deeper than the template
+                    return None
+                flat[flat_key] = value
+        except (KeyError, IndexError, TypeError):
+            return None
+        return flat
+
+    return extract
+
+def _flatten_records_parallel(data: List) -> tuple:
+    """Flatten a large record list across worker processes.
+
+    Flattening is embarrassingly parallel, so split the list into one chunk
+    per core and run _flatten_records on each. Only worth it above
+    _PARALLEL_THRESHOLD records, where the fork/pickle overhead amortizes.
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = os.cpu_count() or 1
+    if workers <= 1:
+        return _flatten_records(data)
+
+    chunk_size = -(-len(data) // workers)
+    chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+    flattened: List[Dict] = []
+    all_dicts = True
+    with ProcessPoolExecutor(workers) as executor:
+        for rows, chunk_all_dicts in executor.map(_flatten_records, chunks):
+            flattened.extend(rows)
+            all_dicts = all_dicts and chunk_all_dicts
+    return flattened, all_dicts
+
+def _blocks_normalize(obj: Any) -> bool:
+    """Check whether a record has a shape json_normalize can't represent.
+
+    Lists need _flatten's index-keyed flattening, empty dicts are leaf
+    values to _flatten but dropped entirely by json_normalize, and
+    non-dict records need the mixed-list handling in _flatten_records.
+    """
+    if type(obj) is not dict:
+        return True
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            return True
+        if isinstance(node, dict):
+            if not node:
+                return True
+            stack.extend(node.values())
+    return False
+
+def _flatten_records(records, value_key: str = "Value") -> tuple:
+    """Flatten an iterable of records, specializing on the first dict's shape.
+
+    Returns (flattened_rows, all_dicts). Non-dict items become
+    {value_key: item} rows and clear the all_dicts flag.
+    """
+    flattened = []
+    extractor = None
+    all_dicts = True
+    for item in records:
+        if type(item) is not dict:
+            all_dicts = False
+            flattened.append({value_key: item})
+        elif extractor is None:
+            extractor = _make_extractor(item)
+            flattened.append(_flatten(item))
+        else:
+            flat = extractor(item)
+            flattened.append(flat if flat is not None else _flatten(item))
+    return flattened, all_dicts
+
 def flatten_nested_json(data: Any) -> List[Dict]:
     """Flatten nested JSON structures."""
     if isinstance(data, list):
-        flattened_list = []
-        for item in data:
-            if isinstance(item, dict):
-                flattened_list.append(flatten_json.flatten(item))
-            else:
-                flattened_list.append({"value": item})
+        # Shares the schema-specialized fast path with json_to_dataframe
+        flattened_list, _ = _flatten_records(data, value_key="value")
         return flattened_list
     elif isinstance(data, dict):
-        return [flatten_json.flatten(data)]
+        if not any(type(v) in (dict, list) for v in data.values()):
+            return [dict(data)]
+        return [_flatten(data)]
     else:
         return [{"value": data}]
 
 def json_to_dataframe(data: Union[Dict, List]) -> pd.DataFrame:
     """Convert JSON data to pandas DataFrame."""
+    import pandas as pd
+
+    # Streamed input (see load_json_stream): flatten records as they arrive
+    # so only the flattened rows are ever held in memory
+    if not isinstance(data, (dict, list)) and hasattr(data, '__next__'):
+        flattened_data, _ = _flatten_records(data)
+        if not flattened_data:
+            return pd.DataFrame()
+        columns = list({key: None for row in flattened_data for key in row})
+        rows = [tuple(row.get(col) for col in columns) for row in flattened_data]
+        return pd.DataFrame.from_records(rows, columns=columns)
 
     # Handle different JSON structures
     if isinstance(data, list):
         if not data:
             return pd.DataFrame()
 
-        # If list contains dictionaries, create DataFrame directly
-        if all(isinstance(item, dict) for item in data):
+        # If list contains dictionaries, create DataFrame directly. Peeking at
+        # the first element avoids a full pre-scan of the list; JSON decoding
+        # only ever produces plain dicts, so an exact type check is safe.
+        if type(data[0]) is dict:
+            # When every record nests only non-empty dicts, pandas'
+            # json_normalize flattens and assembles the frame in one
+            # C-accelerated pass and produces the same key names. Any other
+            # shape (nested lists, empty dicts, mixed types) needs the exact
+            # behaviour of _flatten_records instead.
+            if not any(_blocks_normalize(record) for record in data):
+                normalized = pd.json_normalize(data, sep='_')
+                # json_normalize emits top-level scalars before nested
+                # keys; restore the depth-first order callers expect
+                first_order = list(_flatten(data[0]))
+                seen = set(first_order)
+                if seen.issubset(normalized.columns):
+                    ordered = first_order + [c for c in normalized.columns
+                                             if c not in seen]
+                    return normalized[ordered]
+                # A column json_normalize couldn't represent went missing;
+                # fall through to the lossless flattener
+
             # Flatten nested dictionaries
-            flattened_data = []
-            for item in data:
-                flattened_data.append(flatten_json.flatten(item))
-            return pd.DataFrame(flattened_data)
+            if len(data) >= _PARALLEL_THRESHOLD:
+                flattened_data, all_dicts = _flatten_records_parallel(data)
+            else:
+                flattened_data, all_dicts = _flatten_records(data)
+            if not all_dicts:
+                # Mixed list after all - fall back to the simple path
+                return pd.DataFrame(data, columns=["Value"])
+            # Two-pass build: collect the ordered union of columns first so
+            # pandas doesn't have to re-scan every row to infer the schema
+            columns = list({key: None for row in flattened_data for key in row})
+            rows = [tuple(row.get(col) for col in columns) for row in flattened_data]
+            return pd.DataFrame.from_records(rows, columns=columns)
         else:
             # Mixed types or simple values
             return pd.DataFrame(data, columns=["Value"])
 
     elif isinstance(data, dict):
+        # All-scalar dict: nothing to flatten, build the row directly
+        if not any(type(v) in (dict, list) for v in data.values()):
+            return pd.DataFrame([data])
+
         # Check if it's a nested structure that should be flattened
-        flattened = flatten_json.flatten(data)
+        flattened = _flatten(data)
 
         # Convert to single-row DataFrame if it's a single object
         if len(flattened) == len(data):  # No nested structures
@@ -170,6 +556,71 @@ def json_to_dataframe(data: Union[Dict, List]) -> pd.DataFrame:
         # Simple value
         return pd.DataFrame([{"Value": data}])
 
+def _truncate_object_columns(df: pd.DataFrame, max_width: int) -> pd.DataFrame:
+    """Return a display copy of df with long strings cut to max_width + "...".
+
+    One implementation shared by both table views. Operates on the column's
+    underlying numpy array in a single vectorized pass instead of a per-cell
+    Python apply; untouched columns are shared, not copied.
+    """
+    import numpy as np
+    import pandas as pd
+
+    columns = {}
+    for col in df.columns:
+        s = df[col]
+        if s.dtype == 'object':
+            strs = s.to_numpy().astype(str)
+            lens = np.char.str_len(strs)
+            if lens.size and lens.max() > max_width:
+                # astype to a narrower fixed-width unicode dtype truncates
+                trunc = np.char.add(strs.astype(f"<U{max_width}"), "...")
+                strs = np.where(lens > max_width, trunc, strs)
+            # Wrap in a Series so the values stay positional under df's index
+            columns[col] = pd.Series(strs, index=df.index)
+        else:
+            columns[col] = s
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+def _render_plain(df: pd.DataFrame, index_header: str = "") -> str:
+    """Render a DataFrame as plain space-aligned text without tabulate.
+
+    tabulate's "plain" format still does per-cell width bookkeeping and
+    number re-parsing in Python; a single width pass per column plus
+    ljust/join is much cheaper for the --ascii path.
+    """
+    headers = [index_header] + [str(c) for c in df.columns]
+    columns = [[str(i) for i in df.index]]
+    for col in df.columns:
+        columns.append([str(v) for v in df[col].tolist()])
+    if any('\x1b' in cell for col in columns for cell in col):
+        # Colorized cells carry invisible ANSI codes; measure and pad on
+        # the visible length so headers and rows stay aligned (tabulate
+        # does the same stripping internally)
+        sub = _ANSI_RE.sub
+        visible = [[len(sub('', cell)) for cell in col] for col in columns]
+        widths = [max(len(h), max(v, default=0)) for h, v in zip(headers, visible)]
+        lines = ["  ".join(h.ljust(w) for h, w in zip(headers, widths)).rstrip()]
+        for row, row_vis in zip(zip(*columns), zip(*visible)):
+            lines.append("  ".join(
+                cell + " " * (w - v)
+                for cell, v, w in zip(row, row_vis, widths)).rstrip())
+        return "\n".join(lines)
+    if len(df) > 64:
+        # One vectorized length pass over all cells instead of a Python
+        # len() per cell; below this the array round trip costs more
+        import numpy as np
+        cell_widths = np.char.str_len(np.asarray(columns)).max(axis=1)
+        widths = np.maximum(cell_widths, np.char.str_len(np.asarray(headers))).tolist()
+    else:
+        widths = [max(len(h), max(map(len, col), default=0)) for h, col in zip(headers, columns)]
+    # Build one pre-sized row template for this width set; each row then
+    # costs a single C-level format call instead of per-cell ljust/join
+    tmpl = "  ".join(f"{{:<{w}}}" for w in widths).format
+    lines = [tmpl(*headers).rstrip()]
+    lines.extend(tmpl(*row).rstrip() for row in zip(*columns))
+    return "\n".join(lines)
+
 def display_table(df: pd.DataFrame, table_format: str = "grid", max_width: int = 100, color_enabled: bool = True) -> None:
     """Display DataFrame as a formatted table."""
     if df.empty:
@@ -177,393 +628,763 @@ def display_table(df: pd.DataFrame, table_format: str = "grid", max_width: int =
         return
 
     # Truncate long strings for better display
-    df_display = df.copy()
-    for col in df_display.columns:
-        if df_display[col].dtype == 'object':
-            df_display[col] = df_display[col].astype(str).apply(
-                lambda x: x[:max_width] + "..." if len(x) > max_width else x
-            )
+    df_display = _truncate_object_columns(df, max_width)
 
     # Display table
+    from tabulate import tabulate
     table_info = f"\nTable ({len(df)} rows, {len(df.columns)} columns):"
     print(colorize(table_info, Colors.HEADER, color_enabled))
-    print(colorize("=" * 50, Colors.BOLD, color_enabled))
+    print(colorize(_SEP_50, Colors.BOLD, color_enabled))
     
-    table_str = tabulate(df_display, headers='keys', tablefmt=table_format, showindex=True)
-    if color_enabled and table_format in ["plain", "simple"]:
-        table_str = colorize_table(table_str, color_enabled)
+    # Colorized cells are ANSI-wrapped strings: tabulate's number parsing
+    # can only fail on them, so skip the per-cell float() attempts
+    colorized = (color_enabled and is_color_supported() and
+                 table_format in ["plain", "simple"])
+    if colorized:
+        df_display = _colorize_cells(df_display)
+    if table_format == "plain":
+        table_str = _render_plain(df_display)
+    else:
+        table_str = tabulate(df_display, headers='keys', tablefmt=table_format, showindex=True,
+                             disable_numparse=colorized)
     
     print(table_str)
-    print(colorize("=" * 50, Colors.BOLD, color_enabled))
+    print(colorize(_SEP_50, Colors.BOLD, color_enabled))
 
-def display_hierarchical_table(data: Any, table_format: str = "grid", max_width: int = 100, indent: int = 0, color_enabled: bool = True) -> None:
-    """Display JSON data in a hierarchical table format similar to the image."""
-    prefix = "  " * indent
-    
-    if isinstance(data, dict):
-        print(colorize(f"{prefix}┌─ Object ({len(data)} keys)", Colors.BOLD, color_enabled))
-        for i, (key, value) in enumerate(data.items()):
-            is_last = i == len(data) - 1
-            connector = "└─" if is_last else "├─"
-            
-            if isinstance(value, dict):
-                print(colorize(f"{prefix}{connector} {key}: ", Colors.GREEN, color_enabled) + 
-                      colorize(f"Object ({len(value)} keys)", Colors.CYAN, color_enabled))
-                display_hierarchical_table(value, table_format, max_width, indent + 2, color_enabled)
-            elif isinstance(value, list):
-                print(colorize(f"{prefix}{connector} {key}: ", Colors.GREEN, color_enabled) + 
-                      colorize(f"Array ({len(value)} items)", Colors.YELLOW, color_enabled))
-                display_hierarchical_table(value, table_format, max_width, indent + 2, color_enabled)
+# Formatted leaf values keyed by (id(value), color flag). Only valid while
+# the source tree is alive - ids can be recycled once objects are freed -
+# so call sites clear it when they're done with the tree.
+_fmt_cache: Dict[tuple, str] = {}
+
+def clear_format_cache() -> None:
+    """Drop cached leaf formatting once the displayed tree is released."""
+    _fmt_cache.clear()
+
+def _highlight_cached(value: Any, color_enabled: bool) -> str:
+    key = (id(value), color_enabled)
+    formatted = _fmt_cache.get(key)
+    if formatted is None:
+        formatted = _fmt_cache[key] = highlight_value(value, color_enabled)
+    return formatted
+
+def flatten_hierarchical(data: Any, indent: int = 0, color_enabled: bool = True) -> List[tuple]:
+    """Walk a JSON tree once into format-independent display segments.
+
+    The tree is walked with an explicit stack rather than recursion, so deep
+    structures don't pay a Python call frame per level or risk hitting the
+    recursion limit. Segments are plain tuples: ("line", text) for finished
+    connector/leaf lines, and ("table", records, prefix) for arrays of
+    objects, whose tabular rendering depends on the output format and is
+    left to render_segments. Rendering the same tree in several formats
+    only pays for this walk once.
+    """
+    out: List[tuple] = []
+
+    def _walk_dict(node, ind, prefix):
+        out.append(("line", colorize(f"{prefix}┌─ Object ({len(node)} keys)", Colors.BOLD, color_enabled)))
+        items = list(node.items())
+        push = stack.append
+        last = len(items) - 1
+        for i in range(last, -1, -1):
+            key, value = items[i]
+            connector = "└─" if i == last else "├─"
+            vtype = type(value)
+
+            if vtype is dict:
+                push(("node", value, ind + 2))
+                push(("line", colorize(f"{prefix}{connector} {key}: ", Colors.GREEN, color_enabled) +
+                              colorize(f"Object ({len(value)} keys)", Colors.CYAN, color_enabled)))
+            elif vtype is list:
+                push(("node", value, ind + 2))
+                push(("line", colorize(f"{prefix}{connector} {key}: ", Colors.GREEN, color_enabled) +
+                              colorize(f"Array ({len(value)} items)", Colors.YELLOW, color_enabled)))
             else:
-                print(colorize(f"{prefix}{connector} {key}: ", Colors.GREEN, color_enabled) + 
-                      highlight_value(value, color_enabled))
-                
-    elif isinstance(data, list):
-        if data and isinstance(data[0], dict):
-            # Display as table for array of objects
-            df = pd.DataFrame(data)
-            df_display = df.copy()
-            
-            # Truncate long strings
-            for col in df_display.columns:
-                if df_display[col].dtype == 'object':
-                    df_display[col] = df_display[col].astype(str).apply(
-                        lambda x: x[:max_width] + "..." if len(x) > max_width else x
-                    )
-            
-            # Add index column
-            df_display.insert(0, 'Index', range(len(df_display)))
-            
-            print(colorize(f"{prefix}└─ Table:", Colors.BOLD, color_enabled))
-            table_str = tabulate(df_display, headers='keys', tablefmt=table_format, showindex=False)
-            
-            # Colorize table if using plain/simple format
-            if color_enabled and table_format in ["plain", "simple"]:
-                table_str = colorize_table(table_str, color_enabled)
-            
-            # Indent each line of the table
-            for line in table_str.split('\n'):
-                print(f"{prefix}   {line}")
+                push(("line", colorize(f"{prefix}{connector} {key}: ", Colors.GREEN, color_enabled) +
+                              _highlight_cached(value, color_enabled)))
+
+    def _walk_leaf(node, ind, prefix):
+        out.append(("line", colorize(f"{prefix}└─ ", Colors.BOLD, color_enabled) + _highlight_cached(node, color_enabled)))
+
+    def _walk_list(node, ind, prefix):
+        if node and isinstance(node[0], dict):
+            # Array of objects: formatting depends on the table format,
+            # so emit a table segment and let render_segments handle it
+            out.append(("line", colorize(f"{prefix}└─ Table:", Colors.BOLD, color_enabled)))
+            out.append(("table", node, prefix))
         else:
             # Simple array
-            print(colorize(f"{prefix}└─ Array ({len(data)} items)", Colors.YELLOW, color_enabled))
-            for i, item in enumerate(data):
-                is_last = i == len(data) - 1
+            out.append(("line", colorize(f"{prefix}└─ Array ({len(node)} items)", Colors.YELLOW, color_enabled)))
+            for i, item in enumerate(node):
+                is_last = i == len(node) - 1
                 connector = "└─" if is_last else "├─"
-                print(colorize(f"{prefix}   {connector} [{i}]: ", Colors.CYAN, color_enabled) + 
-                      highlight_value(item, color_enabled))
-    else:
-        print(colorize(f"{prefix}└─ ", Colors.BOLD, color_enabled) + highlight_value(data, color_enabled))
+                out.append(("line", colorize(f"{prefix}   {connector} [{i}]: ", Colors.CYAN, color_enabled) +
+                      _highlight_cached(item, color_enabled)))
+
+    # Stack holds ("node", data, indent) entries to render, plus ("line", text)
+    # entries for connector lines the parent emits ahead of a nested child.
+    # Children are pushed in reverse so pop() yields them in original order.
+    # Node handling dispatches on exact type: JSON trees only contain plain
+    # dict/list containers, so one dict lookup replaces the isinstance ladder.
+    stack = [("node", data, indent)]
+    dispatch = {dict: _walk_dict, list: _walk_list}
+    # Bind the loop's method lookups once; with O(1) work per node the
+    # attribute fetches are a measurable share of the walk
+    pop = stack.pop
+    append_seg = out.append
+    dispatch_get = dispatch.get
+    while stack:
+        entry = pop()
+        if entry[0] == "line":
+            append_seg(entry)
+            continue
+
+        _, node, ind = entry
+        prefix = _PREFIXES[ind] if ind < 64 else "  " * ind
+        dispatch_get(type(node), _walk_leaf)(node, ind, prefix)
+
+    return out
+
+def render_segments(segments: List[tuple], table_format: str = "grid", max_width: int = 100, color_enabled: bool = True) -> List[str]:
+    """Render flattened segments into output lines for one table format."""
+    import pandas as pd
+    from tabulate import tabulate
+
+    lines: List[str] = []
+    for seg in segments:
+        if seg[0] == "line":
+            lines.append(seg[1])
+            continue
+
+        _, node, prefix = seg
+        df = pd.DataFrame(node)
+        df_display = _truncate_object_columns(df, max_width)
+
+        # Colorize values if using plain/simple format; colorized
+        # cells are ANSI strings tabulate could never parse as
+        # numbers, so tell it not to try
+        colorized = (color_enabled and is_color_supported() and
+                     table_format in ["plain", "simple"])
+        if colorized:
+            df_display = _colorize_cells(df_display)
+
+        if table_format == "plain":
+            # Column-at-a-time renderer, same as the flat table path
+            table_str = _render_plain(df_display, index_header='Index')
+        else:
+            if colorized:
+                # Same cyan the cell colorizer gives numeric columns
+                index_values = [f"{Colors.CYAN}{i}{Colors.END}"
+                                for i in range(len(df_display))]
+            else:
+                index_values = range(len(df_display))
+            # Hand the index straight to tabulate instead of
+            # insert()ing an Index column, which copies and
+            # reconsolidates the frame
+            table_str = tabulate(df_display, headers=['Index'] + list(df_display.columns),
+                                 tablefmt=table_format, showindex=index_values,
+                                 disable_numparse=colorized)
+
+        # Indent each line of the table
+        for line in table_str.split('\n'):
+            lines.append(f"{prefix}   {line}")
+    return lines
+
+def display_hierarchical_table(data: Any, table_format: str = "grid", max_width: int = 100, indent: int = 0, color_enabled: bool = True, out: List[str] = None) -> None:
+    """Display JSON data in a hierarchical table format similar to the image.
+
+    Thin wrapper over flatten_hierarchical + render_segments; callers that
+    need several formats of the same tree should use those directly so the
+    walk happens once.
+    """
+    flush = out is None
+    if out is None:
+        out = []
+
+    segments = flatten_hierarchical(data, indent, color_enabled)
+    out.extend(render_segments(segments, table_format, max_width, color_enabled))
+
+    if flush and out:
+        sys.stdout.write("\n".join(out) + "\n")
+
+def render_hierarchical_view(segments: List[tuple], table_format: str = "grid", max_width: int = 100, color_enabled: bool = True) -> str:
+    """Banner, rendered segments and closing rule as one string."""
+    out = [colorize("\nJSON Structure Display:", Colors.HEADER, color_enabled),
+           colorize(_SEP_60, Colors.BOLD, color_enabled)]
+    out.extend(render_segments(segments, table_format, max_width, color_enabled))
+    out.append(colorize(_SEP_60, Colors.BOLD, color_enabled))
+    return "\n".join(out) + "\n"
 
 def display_hierarchical_json(data: Any, table_format: str = "grid", max_width: int = 100, color_enabled: bool = True) -> None:
     """Display JSON data in a hierarchical format with proper table formatting."""
-    print(colorize("\nJSON Structure Display:", Colors.HEADER, color_enabled))
-    print(colorize("=" * 60, Colors.BOLD, color_enabled))
-    display_hierarchical_table(data, table_format, max_width, color_enabled=color_enabled)
-    print(colorize("=" * 60, Colors.BOLD, color_enabled))
+    # Headers, tree and trailing rule all go out in one buffered write
+    segments = flatten_hierarchical(data, color_enabled=color_enabled)
+    sys.stdout.write(render_hierarchical_view(segments, table_format, max_width, color_enabled))
 
 def save_to_csv(df: pd.DataFrame, output_path: str) -> None:
     """Save DataFrame to CSV file."""
     try:
-        df.to_csv(output_path, index=False)
+        if pa is not None:
+            # Arrow writes CSV from columnar data in C, several times faster
+            # than DataFrame.to_csv's per-row Python formatting
+            pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), output_path)
+        else:
+            df.to_csv(output_path, index=False)
         print(f"\nData saved to: {output_path}")
     except Exception as e:
         print(f"Error saving to CSV: {e}")
 
 def analyze_structure(data: Any, indent: int = 0, color_enabled: bool = True) -> None:
-    """Analyze and display JSON structure."""
-    prefix = "  " * indent
-
-    if isinstance(data, dict):
-        print(colorize(f"{prefix}Object ({len(data)} keys):", Colors.BOLD, color_enabled))
-        for key, value in data.items():
-            print(colorize(f"{prefix}  - {key}: ", Colors.GREEN, color_enabled) + 
-                  colorize(f"{type(value).__name__}", Colors.CYAN, color_enabled))
-            if isinstance(value, (dict, list)) and indent < 2:
-                analyze_structure(value, indent + 2, color_enabled)
-    elif isinstance(data, list):
-        print(colorize(f"{prefix}Array ({len(data)} items):", Colors.YELLOW, color_enabled))
-        if data:
-            item_types = set(type(item).__name__ for item in data)
-            print(colorize(f"{prefix}  Item types: ", Colors.BLUE, color_enabled) + 
-                  colorize(f"{', '.join(item_types)}", Colors.CYAN, color_enabled))
-            if len(data) > 0 and isinstance(data[0], (dict, list)) and indent < 2:
-                print(colorize(f"{prefix}  Sample item structure:", Colors.BOLD, color_enabled))
-                analyze_structure(data[0], indent + 2, color_enabled)
-    else:
-        print(colorize(f"{prefix}Value: ", Colors.BLUE, color_enabled) + 
-              colorize(f"{type(data).__name__}", Colors.CYAN, color_enabled))
+    """Analyze and display JSON structure.
 
-def detect_field_pattern(value: Any) -> dict:
-    """Detect patterns and characteristics of a field value."""
+    Iterative depth-first walk; see display_hierarchical_table for the
+    stack layout.
+    """
+    out = []
+    stack = [("node", data, indent)]
+    while stack:
+        entry = stack.pop()
+        if entry[0] == "line":
+            out.append(entry[1])
+            continue
+
+        _, node, ind = entry
+        prefix = _PREFIXES[ind] if ind < 64 else "  " * ind
+
+        if isinstance(node, dict):
+            out.append(colorize(f"{prefix}Object ({len(node)} keys):", Colors.BOLD, color_enabled))
+            items = list(node.items())
+            for i in range(len(items) - 1, -1, -1):
+                key, value = items[i]
+                if isinstance(value, (dict, list)) and ind < 2:
+                    stack.append(("node", value, ind + 2))
+                vname = _TYPE_NAMES.get(type(value)) or type(value).__name__
+                stack.append(("line", colorize(f"{prefix}  - {key}: ", Colors.GREEN, color_enabled) + 
+                              colorize(vname, Colors.CYAN, color_enabled)))
+        elif isinstance(node, list):
+            out.append(colorize(f"{prefix}Array ({len(node)} items):", Colors.YELLOW, color_enabled))
+            if node:
+                item_types = set(_TYPE_NAMES.get(type(item)) or type(item).__name__
+                                 for item in node)
+                out.append(colorize(f"{prefix}  Item types: ", Colors.BLUE, color_enabled) + 
+                           colorize(f"{', '.join(item_types)}", Colors.CYAN, color_enabled))
+                if isinstance(node[0], (dict, list)) and ind < 2:
+                    out.append(colorize(f"{prefix}  Sample item structure:", Colors.BOLD, color_enabled))
+                    stack.append(("node", node[0], ind + 2))
+        else:
+            out.append(colorize(f"{prefix}Value: ", Colors.BLUE, color_enabled) + 
+                       colorize(_TYPE_NAMES.get(type(node)) or type(node).__name__,
+                                Colors.CYAN, color_enabled))
+
+    # One syscall for the whole report instead of a print per line
+    sys.stdout.write("\n".join(out) + "\n")
+
+@functools.lru_cache(maxsize=4096)
+def _detect_str_pattern(value_str: str) -> tuple:
+    """Classify a string value, returning the template as an items tuple.
+
+    Cached because real datasets repeat the same values (status codes,
+    categories, identifiers) across thousands of records.
+    """
+    m = _STR_PATTERN_RE.match(value_str)
+    if m is not None:
+        info = _STR_TEMPLATES[m.lastgroup].copy()
+        info["example"] = value_str
+        return tuple(info.items())
+    # Empty string
+    if value_str == "":
+        return (
+            ("type", "string"),
+            ("description", "Empty string"),
+            ("example", "")
+        )
+    # General string
+    return (
+        ("type", "string"),
+        ("description", "Text string"),
+        ("example", value_str[:50] + "..." if len(value_str) > 50 else value_str)
+    )
+
+# Shared example-free templates handed out by detect_field_pattern when
+# the caller doesn't want per-value examples; read-only so one instance
+# can serve every call
+_SHARED_TEMPLATES = {
+    name: MappingProxyType(dict(template))
+    for name, template in _STR_TEMPLATES.items()
+}
+_SHARED_TEMPLATES.update({
+    "null": MappingProxyType({"type": "null", "description": "Null value"}),
+    "empty_string": MappingProxyType({"type": "string", "description": "Empty string"}),
+    "string": MappingProxyType({"type": "string", "description": "Text string"}),
+    "boolean": MappingProxyType({"type": "boolean", "description": "Boolean value"}),
+    "integer": MappingProxyType({"type": "integer", "description": "Integer number"}),
+    "number": MappingProxyType({"type": "number", "description": "Decimal number"}),
+})
+
+def detect_field_pattern(value: Any, include_example: bool = True) -> dict:
+    """Detect patterns and characteristics of a field value.
+
+    With include_example=False a shared read-only template is returned
+    instead of a fresh dict; callers must copy it before mutating.
+    """
     if value is None:
+        if not include_example:
+            return _SHARED_TEMPLATES["null"]
         return {"type": "null", "description": "Null value"}
     
+    if isinstance(value, str):
+        if not include_example:
+            m = _STR_PATTERN_RE.match(value)
+            if m is not None:
+                return _SHARED_TEMPLATES[m.lastgroup]
+            return _SHARED_TEMPLATES["empty_string" if value == "" else "string"]
+        return dict(_detect_str_pattern(value))
+    
     value_str = str(value)
     
-    # Date patterns
-    if isinstance(value, str):
-        # MM/DD/YYYY HH:MM:SS
-        if re.match(r'^\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}:\d{2}$', value_str):
-            return {
-                "type": "string",
-                "format": "datetime",
-                "pattern": r'^\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}:\d{2}$',
-                "description": "Date and time in MM/DD/YYYY HH:MM:SS format",
-                "example": value_str
-            }
-        # MM/DD/YYYY
-        elif re.match(r'^\d{1,2}/\d{1,2}/\d{4}$', value_str):
-            return {
-                "type": "string",
-                "format": "date",
-                "pattern": r'^\d{1,2}/\d{1,2}/\d{4}$',
-                "description": "Date in MM/DD/YYYY format",
-                "example": value_str
-            }
-        # Email pattern
-        elif re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', value_str):
-            return {
-                "type": "string",
-                "format": "email",
-                "pattern": r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$',
-                "description": "Email address",
-                "example": value_str
-            }
-        # ID/Key patterns (uppercase letters, numbers, hyphens, underscores)
-        elif re.match(r'^[A-Z0-9_-]+$', value_str):
-            return {
-                "type": "string",
-                "pattern": r'^[A-Z0-9_-]+$',
-                "description": "Identifier or key",
-                "example": value_str
-            }
-        # Numeric string
-        elif re.match(r'^[0-9]+$', value_str):
-            return {
-                "type": "string",
-                "pattern": r'^[0-9]+$',
-                "description": "Numeric string",
-                "example": value_str
-            }
-        # Empty string
-        elif value_str == "":
-            return {
-                "type": "string",
-                "description": "Empty string",
-                "example": ""
-            }
-        # General string
-        else:
-            return {
-                "type": "string",
-                "description": "Text string",
-                "example": value_str[:50] + "..." if len(value_str) > 50 else value_str
-            }
+    # Boolean must come before the number check: bool subclasses int, so
+    # the old order classified True/False as integers
+    if isinstance(value, bool):
+        if not include_example:
+            return _SHARED_TEMPLATES["boolean"]
+        return {
+            "type": "boolean",
+            "description": "Boolean value",
+            "example": value
+        }
     
     # Number types
     elif isinstance(value, (int, float)):
         if isinstance(value, int):
+            if not include_example:
+                return _SHARED_TEMPLATES["integer"]
             return {
                 "type": "integer",
                 "description": "Integer number",
                 "example": value
             }
         else:
+            if not include_example:
+                return _SHARED_TEMPLATES["number"]
             return {
                 "type": "number",
                 "description": "Decimal number",
                 "example": value
             }
     
-    # Boolean
-    elif isinstance(value, bool):
-        return {
-            "type": "boolean",
-            "description": "Boolean value",
-            "example": value
-        }
-    
     # Default
     else:
+        if not include_example:
+            return {
+                "type": str(type(value).__name__),
+                "description": f"{type(value).__name__} value"
+            }
         return {
             "type": str(type(value).__name__),
             "description": f"{type(value).__name__} value",
             "example": value_str
         }
 
-def analyze_field_statistics(values: list) -> dict:
-    """Analyze statistics for a field across multiple values."""
-    if not values:
-        return {}
+class _FieldAccumulator:
+    """Single-pass statistics accumulator for one field's values.
+
+    Missing keys never reach add(), so the caller passes the real record
+    count to statistics() and the difference is reported as nulls.
+    """
     
-    # Remove None values for analysis
-    non_null_values = [v for v in values if v is not None]
+    __slots__ = ("non_null", "types", "all_numeric", "all_strings",
+                 "num_min", "num_max", "num_sum", "len_min", "len_max",
+                 "len_sum", "value_counts", "sample")
     
-    stats = {
-        "total_count": len(values),
-        "null_count": len(values) - len(non_null_values),
-        "null_rate": (len(values) - len(non_null_values)) / len(values) if values else 0
-    }
+    def __init__(self):
+        self.non_null = 0
+        self.types = set()
+        self.all_numeric = True
+        self.all_strings = True
+        self.num_min = None
+        self.num_max = None
+        self.num_sum = 0
+        self.len_min = None
+        self.len_max = None
+        self.len_sum = 0
+        self.value_counts: Counter = Counter()
+        self.sample = None
     
-    if non_null_values:
-        # Type analysis
-        types = set(type(v).__name__ for v in non_null_values)
-        stats["types"] = list(types)
+    def add(self, v: Any) -> None:
+        if v is None:
+            return
+        if self.sample is None:
+            self.sample = v
+        self.non_null += 1
+        self.types.add(type(v).__name__)
+        if self.all_numeric:
+            # type() check keeps booleans out of the numeric min/max/avg
+            if type(v) in (int, float):
+                if self.num_min is None or v < self.num_min:
+                    self.num_min = v
+                if self.num_max is None or v > self.num_max:
+                    self.num_max = v
+                self.num_sum += v
+            else:
+                self.all_numeric = False
+        if self.all_strings:
+            if isinstance(v, str):
+                length = len(v)
+                if self.len_min is None or length < self.len_min:
+                    self.len_min = length
+                if self.len_max is None or length > self.len_max:
+                    self.len_max = length
+                self.len_sum += length
+                self.value_counts[v] += 1
+            else:
+                self.all_strings = False
+    
+    def merge(self, other: _FieldAccumulator) -> None:
+        """Fold in an accumulator built from a later chunk of the data."""
+        if self.sample is None:
+            self.sample = other.sample
+        self.non_null += other.non_null
+        self.types |= other.types
+        self.all_numeric = self.all_numeric and other.all_numeric
+        self.all_strings = self.all_strings and other.all_strings
+        if other.num_min is not None and (self.num_min is None or other.num_min < self.num_min):
+            self.num_min = other.num_min
+        if other.num_max is not None and (self.num_max is None or other.num_max > self.num_max):
+            self.num_max = other.num_max
+        self.num_sum += other.num_sum
+        if other.len_min is not None and (self.len_min is None or other.len_min < self.len_min):
+            self.len_min = other.len_min
+        if other.len_max is not None and (self.len_max is None or other.len_max > self.len_max):
+            self.len_max = other.len_max
+        self.len_sum += other.len_sum
+        self.value_counts += other.value_counts
+    
+    def statistics(self, total: int) -> dict:
+        if not total:
+            return {}
         
-        # Value analysis
-        if all(isinstance(v, (int, float)) for v in non_null_values):
-            stats["min"] = min(non_null_values)
-            stats["max"] = max(non_null_values)
-            stats["avg"] = sum(non_null_values) / len(non_null_values)
+        stats = {
+            "total_count": total,
+            "null_count": total - self.non_null,
+            "null_rate": (total - self.non_null) / total
+        }
         
-        # String analysis
-        if all(isinstance(v, str) for v in non_null_values):
-            stats["min_length"] = min(len(v) for v in non_null_values)
-            stats["max_length"] = max(len(v) for v in non_null_values)
-            stats["avg_length"] = sum(len(v) for v in non_null_values) / len(non_null_values)
+        if self.non_null:
+            stats["types"] = list(self.types)
             
-            # Check for unique values
-            unique_values = set(non_null_values)
-            stats["unique_count"] = len(unique_values)
-            stats["uniqueness_rate"] = len(unique_values) / len(non_null_values)
+            if self.all_numeric:
+                stats["min"] = self.num_min
+                stats["max"] = self.num_max
+                stats["avg"] = self.num_sum / self.non_null
             
-            # Most common values
-            from collections import Counter
-            value_counts = Counter(non_null_values)
-            stats["most_common"] = value_counts.most_common(3)
+            if self.all_strings:
+                stats["min_length"] = self.len_min
+                stats["max_length"] = self.len_max
+                stats["avg_length"] = self.len_sum / self.non_null
+                stats["unique_count"] = len(self.value_counts)
+                stats["uniqueness_rate"] = len(self.value_counts) / self.non_null
+                stats["most_common"] = self.value_counts.most_common(3)
+        
+        return stats
+
+def _vector_field_statistics(values: list) -> Optional[dict]:
+    """Vectorized statistics for a homogeneous, fully non-null value list.
+
+    Returns None when the values don't form a clean int, float or str
+    column; the caller then falls back to the per-value accumulator.
+    """
+    vtypes = set(map(type, values))
+    if len(vtypes) != 1:
+        return None
+    vtype = next(iter(vtypes))
+    if vtype not in (int, float, str):
+        return None
+    
+    import numpy as np
+    
+    stats = {
+        "total_count": len(values),
+        "null_count": 0,
+        "null_rate": 0.0,
+        "types": [vtype.__name__]
+    }
+    
+    if vtype is str:
+        lengths = np.char.str_len(np.asarray(values))
+        value_counts = Counter(values)
+        stats["min_length"] = int(lengths.min())
+        stats["max_length"] = int(lengths.max())
+        stats["avg_length"] = int(lengths.sum()) / len(values)
+        stats["unique_count"] = len(value_counts)
+        stats["uniqueness_rate"] = len(value_counts) / len(values)
+        stats["most_common"] = value_counts.most_common(3)
+    else:
+        try:
+            arr = np.asarray(values)
+        except OverflowError:
+            return None
+        if arr.dtype.kind not in ("i", "f"):
+            # e.g. integers beyond int64 range
+            return None
+        stats["min"] = arr.min().item()
+        stats["max"] = arr.max().item()
+        stats["avg"] = arr.sum().item() / len(values)
     
     return stats
 
-def generate_schema(data: Any, field_name: str = "root", detailed: bool = False) -> dict:
-    """Generate JSON schema from data."""
-    if isinstance(data, dict):
-        schema = {
-            "type": "object",
-            "properties": {},
-            "required": []
+def analyze_field_statistics(values: list) -> dict:
+    """Analyze statistics for a field across multiple values."""
+    # Vectorize big columns; below this the numpy round trip costs more
+    # than the plain loop
+    if len(values) > 64:
+        stats = _vector_field_statistics(values)
+        if stats is not None:
+            return stats
+    
+    acc = _FieldAccumulator()
+    for v in values:
+        acc.add(v)
+    return acc.statistics(len(values))
+
+def _dict_schema(data: dict, detailed: bool) -> dict:
+    schema = {
+        "type": "object",
+        "properties": {},
+        "required": []
+    }
+    
+    for key, value in data.items():
+        if value is not None:
+            schema["properties"][key] = generate_schema(value, key, detailed)
+            # Consider field required if it's not None in this sample
+            schema["required"].append(key)
+    
+    return schema
+
+def _list_schema(data: list, detailed: bool) -> dict:
+    if not data:
+        return {
+            "type": "array",
+            "description": "Empty array",
+            "items": {}
         }
-        
-        for key, value in data.items():
-            if value is not None:
-                schema["properties"][key] = generate_schema(value, key, detailed)
-                # Consider field required if it's not None in this sample
-                schema["required"].append(key)
-        
-        return schema
     
-    elif isinstance(data, list):
-        if not data:
+    # Determine the schema for array items
+    if all(isinstance(item, dict) for item in data):
+        # Array of objects: accumulate per-key statistics in a single
+        # pass over the items, in first-seen key order
+        if len(data) > _SCHEMA_PARALLEL_THRESHOLD:
+            accumulators = _accumulate_fields_parallel(data)
+        else:
+            accumulators = _accumulate_fields(data)
+        
+        return _object_array_schema(accumulators, len(data), detailed)
+    else:
+        # Array of simple values
+        sample_value = data[0] if data else None
+        if sample_value is not None:
+            pattern_info = detect_field_pattern(sample_value)
             return {
                 "type": "array",
-                "description": "Empty array",
-                "items": {}
+                "description": f"Array of {len(data)} items",
+                "items": pattern_info
             }
+        else:
+            return {
+                "type": "array",
+                "description": "Array of items",
+                "items": {"type": "string"}
+            }
+
+# Container handlers dispatched by exact type; JSON parsing only ever
+# produces plain dict and list, so this replaces the isinstance ladder
+_SCHEMA_DISPATCH = {
+    dict: _dict_schema,
+    list: _list_schema,
+}
+
+def generate_schema(data: Any, field_name: str = "root", detailed: bool = False) -> dict:
+    """Generate JSON schema from data."""
+    handler = _SCHEMA_DISPATCH.get(type(data))
+    if handler is not None:
+        return handler(data, detailed)
+    # Simple value
+    return detect_field_pattern(data)
+
+def _accumulate_fields(items) -> Dict[str, _FieldAccumulator]:
+    """Accumulate per-key statistics over dict records, first-seen order."""
+    accumulators: Dict[str, _FieldAccumulator] = {}
+    for item in items:
+        for key, value in item.items():
+            acc = accumulators.get(key)
+            if acc is None:
+                acc = accumulators[key] = _FieldAccumulator()
+            acc.add(value)
+    return accumulators
+
+def _accumulate_fields_parallel(data: List) -> Dict[str, _FieldAccumulator]:
+    """Accumulate field statistics for a large record list across workers.
+
+    Same chunking scheme as _flatten_records_parallel; per-chunk
+    accumulators are merged in chunk order so key order, samples and
+    most_common ties come out exactly as in the sequential pass.
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = os.cpu_count() or 1
+    if workers <= 1:
+        return _accumulate_fields(data)
+
+    chunk_size = -(-len(data) // workers)
+    chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+    accumulators: Dict[str, _FieldAccumulator] = {}
+    with ProcessPoolExecutor(workers) as executor:
+        for chunk_accs in executor.map(_accumulate_fields, chunks):
+            for key, acc in chunk_accs.items():
+                mine = accumulators.get(key)
+                if mine is None:
+                    accumulators[key] = acc
+                else:
+                    mine.merge(acc)
+    return accumulators
+
+def _object_array_schema(accumulators: Dict[str, _FieldAccumulator],
+                         total: int, detailed: bool) -> dict:
+    """Build the merged array-of-objects schema from per-key accumulators."""
+    merged_schema = {"type": "object", "properties": {}, "required": []}
+    
+    for key, acc in accumulators.items():
+        field_stats = acc.statistics(total)
         
-        # Determine the schema for array items
-        if all(isinstance(item, dict) for item in data):
-            # Array of objects - merge schemas
-            merged_schema = {"type": "object", "properties": {}, "required": []}
+        if acc.sample is not None:
+            pattern_info = detect_field_pattern(acc.sample)
             
-            # Collect all unique keys
-            all_keys = set()
-            for item in data:
-                all_keys.update(item.keys())
+            merged_schema["properties"][key] = pattern_info.copy()
             
-            # Analyze each field across all items
-            for key in all_keys:
-                field_values = [item.get(key) for item in data]
-                field_stats = analyze_field_statistics(field_values)
-                
-                # Get sample value for pattern detection
-                sample_value = next((v for v in field_values if v is not None), None)
-                if sample_value is not None:
-                    pattern_info = detect_field_pattern(sample_value)
-                    
-                    merged_schema["properties"][key] = pattern_info.copy()
-                    
-                    if detailed:
-                        merged_schema["properties"][key].update({
-                            "statistics": field_stats
-                        })
-                    
-                    # Consider required if not null in most cases
-                    if field_stats.get("null_rate", 0) < 0.5:
-                        merged_schema["required"].append(key)
+            if detailed:
+                merged_schema["properties"][key].update({
+                    "statistics": field_stats
+                })
             
-            return {
-                "type": "array",
-                "description": f"Array of {len(data)} objects",
-                "items": merged_schema
-            }
-        else:
-            # Array of simple values
-            sample_value = data[0] if data else None
-            if sample_value is not None:
-                pattern_info = detect_field_pattern(sample_value)
-                return {
-                    "type": "array",
-                    "description": f"Array of {len(data)} items",
-                    "items": pattern_info
-                }
+            # Consider required if not null in most cases
+            if field_stats.get("null_rate", 0) < 0.5:
+                merged_schema["required"].append(key)
+    
+    return {
+        "type": "array",
+        "description": f"Array of {total} objects",
+        "items": merged_schema
+    }
+
+def generate_schema_streaming(file_path: str, detailed: bool = False) -> dict:
+    """Generate a schema for a top-level JSON array without loading it fully.
+
+    Mirrors the list branch of generate_schema, but feeds records straight
+    from load_json_stream into the per-field accumulators so memory is
+    bounded by the number of distinct keys rather than the file size.
+    """
+    accumulators: Dict[str, _FieldAccumulator] = {}
+    total = 0
+    all_dicts = True
+    first_item = None
+    
+    for item in load_json_stream(file_path):
+        if total == 0:
+            first_item = item
+        total += 1
+        if all_dicts:
+            if isinstance(item, dict):
+                for key, value in item.items():
+                    acc = accumulators.get(key)
+                    if acc is None:
+                        acc = accumulators[key] = _FieldAccumulator()
+                    acc.add(value)
             else:
-                return {
-                    "type": "array",
-                    "description": "Array of items",
-                    "items": {"type": "string"}
-                }
+                all_dicts = False
     
+    if not total:
+        return {
+            "type": "array",
+            "description": "Empty array",
+            "items": {}
+        }
+    
+    if all_dicts:
+        return _object_array_schema(accumulators, total, detailed)
+    
+    # Array of simple values, classified from the first item as in the
+    # in-memory path
+    if first_item is not None:
+        return {
+            "type": "array",
+            "description": f"Array of {total} items",
+            "items": detect_field_pattern(first_item)
+        }
     else:
-        # Simple value
-        return detect_field_pattern(data)
+        return {
+            "type": "array",
+            "description": "Array of items",
+            "items": {"type": "string"}
+        }
 
 def display_schema(schema: dict, color_enabled: bool = True, detailed: bool = False) -> None:
     """Display schema in a readable format."""
-    print(colorize("\n📋 JSON Schema Analysis", Colors.HEADER, color_enabled))
-    print(colorize("=" * 60, Colors.BOLD, color_enabled))
+    out = [colorize("\n📋 JSON Schema Analysis", Colors.HEADER, color_enabled),
+           colorize(_SEP_60, Colors.BOLD, color_enabled)]
     
     def display_schema_recursive(schema_part: dict, indent: int = 0, name: str = "root"):
-        prefix = "  " * indent
+        prefix = _PREFIXES[indent] if indent < 64 else "  " * indent
         
         if schema_part.get("type") == "object":
-            print(colorize(f"{prefix}📁 {name}: object", Colors.BOLD, color_enabled))
+            out.append(colorize(f"{prefix}📁 {name}: object", Colors.BOLD, color_enabled))
             if "properties" in schema_part:
                 for prop_name, prop_schema in schema_part["properties"].items():
                     display_schema_recursive(prop_schema, indent + 1, prop_name)
         elif schema_part.get("type") == "array":
-            print(colorize(f"{prefix}📋 {name}: array", Colors.YELLOW, color_enabled))
+            out.append(colorize(f"{prefix}📋 {name}: array", Colors.YELLOW, color_enabled))
             if "items" in schema_part:
                 display_schema_recursive(schema_part["items"], indent + 1, "item")
         else:
             # Simple type
             type_icon = "🔤" if schema_part.get("type") == "string" else "🔢" if schema_part.get("type") in ["integer", "number"] else "✅" if schema_part.get("type") == "boolean" else "❓"
-            print(colorize(f"{prefix}{type_icon} {name}: {schema_part.get('type', 'unknown')}", Colors.CYAN, color_enabled))
+            out.append(colorize(f"{prefix}{type_icon} {name}: {schema_part.get('type', 'unknown')}", Colors.CYAN, color_enabled))
             
             if "description" in schema_part:
-                print(colorize(f"{prefix}   📝 {schema_part['description']}", Colors.BLUE, color_enabled))
+                out.append(colorize(f"{prefix}   📝 {schema_part['description']}", Colors.BLUE, color_enabled))
             
             if "example" in schema_part:
-                print(colorize(f"{prefix}   💡 Example: {schema_part['example']}", Colors.GREEN, color_enabled))
+                out.append(colorize(f"{prefix}   💡 Example: {schema_part['example']}", Colors.GREEN, color_enabled))
             
             if detailed and "statistics" in schema_part:
                 stats = schema_part["statistics"]
                 if "null_rate" in stats:
                     null_percent = stats["null_rate"] * 100
-                    print(colorize(f"{prefix}   📊 Null rate: {null_percent:.1f}%", Colors.YELLOW, color_enabled))
+                    out.append(colorize(f"{prefix}   📊 Null rate: {null_percent:.1f}%", Colors.YELLOW, color_enabled))
                 
                 if "unique_count" in stats:
-                    print(colorize(f"{prefix}   🔑 Unique values: {stats['unique_count']}", Colors.CYAN, color_enabled))
+                    out.append(colorize(f"{prefix}   🔑 Unique values: {stats['unique_count']}", Colors.CYAN, color_enabled))
     
     display_schema_recursive(schema)
-    print(colorize("=" * 60, Colors.BOLD, color_enabled))
+    out.append(colorize(_SEP_60, Colors.BOLD, color_enabled))
+    # One syscall for the whole report instead of a print per line
+    sys.stdout.write("\n".join(out) + "\n")
+
+def _schema_json_bytes(schema: dict) -> bytes:
+    """Serialize a schema to pretty-printed UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(schema, option=orjson.OPT_INDENT_2)
+    return json.dumps(schema, indent=2, ensure_ascii=False).encode("utf-8")
 
 def save_schema_to_file(schema: dict, output_path: str, format_type: str = "json") -> None:
     """Save schema to file in specified format."""
     try:
         if format_type == "json":
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(schema, f, indent=2, ensure_ascii=False)
+            # Serialize to bytes (orjson when available) and skip the
+            # text-mode encode step
+            with open(output_path, 'wb') as f:
+                f.write(_schema_json_bytes(schema))
         elif format_type == "yaml":
+            import yaml
             with open(output_path, 'w', encoding='utf-8') as f:
                 yaml.dump(schema, f, default_flow_style=False, allow_unicode=True)
         elif format_type == "md":
@@ -571,7 +1392,7 @@ def save_schema_to_file(schema: dict, output_path: str, format_type: str = "json
                 f.write("# JSON Schema Documentation\n\n")
                 f.write("## Schema Definition\n\n")
                 f.write("```json\n")
-                f.write(json.dumps(schema, indent=2))
+                f.write(_schema_json_bytes(schema).decode("utf-8"))
                 f.write("\n```\n\n")
                 f.write("## Field Descriptions\n\n")
                 # Add field descriptions here
@@ -583,6 +1404,8 @@ def save_schema_to_file(schema: dict, output_path: str, format_type: str = "json
         print(f"Error saving schema: {e}")
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Convert JSON files to tabular format")
     parser.add_argument("json_file", help="Path to the JSON file")
     parser.add_argument("-f", "--format", choices=["grid", "plain", "simple", "github", "fancy_grid"],
@@ -605,6 +1428,8 @@ def main():
     parser.add_argument("--schema-detailed", action="store_true",
                        help="Generate detailed schema with statistics")
     parser.add_argument("--output-schema", help="Save schema to file (specify format: .json, .yaml, .md)")
+    parser.add_argument("--streaming", action="store_true",
+                       help="Stream top-level array records instead of loading the full file (requires ijson)")
 
     args = parser.parse_args()
 
@@ -613,9 +1438,22 @@ def main():
         print(f"Error: File '{args.json_file}' does not exist.")
         sys.exit(1)
 
-    # Load JSON data
+    # Load JSON data. Streaming helps the tabular path, and the schema can
+    # make its own streaming pass; the structure and hierarchical views
+    # still need the full tree in memory.
+    needs_full_tree = args.structure or args.hierarchical
+    use_streaming = (ijson is not None and not needs_full_tree and
+                     (args.streaming or
+                      Path(args.json_file).stat().st_size > _STREAM_THRESHOLD) and
+                     _is_top_level_array(args.json_file))
     print(f"Loading JSON file: {args.json_file}")
-    data = load_json_file(args.json_file)
+    if args.json_file.endswith(('.jsonl', '.ndjson')):
+        # Newline-delimited records; a regular JSON parse would reject them
+        data = load_ndjson_file(args.json_file)
+    elif use_streaming:
+        data = load_json_stream(args.json_file)
+    else:
+        data = load_json_file(args.json_file)
 
     # Determine color setting
     if args.color:
@@ -629,7 +1467,12 @@ def main():
     if args.schema or args.schema_detailed:
         detailed = args.schema_detailed
         print(colorize("Generating JSON schema...", Colors.HEADER, color_enabled))
-        schema = generate_schema(data, detailed=detailed)
+        if use_streaming:
+            # Separate pass over the file so the record stream stays
+            # available for the table below
+            schema = generate_schema_streaming(args.json_file, detailed=detailed)
+        else:
+            schema = generate_schema(data, detailed=detailed)
         display_schema(schema, color_enabled, detailed)
         
         # Save schema to file if requested
@@ -652,23 +1495,32 @@ def main():
         analyze_structure(data, color_enabled=color_enabled)
         print()
 
-    # Convert to DataFrame
-    print("Converting to tabular format...")
-    df = json_to_dataframe(data)
-    
+    # Convert to DataFrame. The hierarchical view renders from the raw tree,
+    # so skip the whole flatten/DataFrame build unless the table view or a
+    # CSV export actually needs it.
+    df = None
+    if args.output or not args.hierarchical:
+        print("Converting to tabular format...")
+        df = json_to_dataframe(data)
+
     # Display table
     table_format = "plain" if args.ascii else args.format
     
     if args.hierarchical:
         display_hierarchical_json(data, table_format, args.width, color_enabled)
+        clear_format_cache()
     else:
         display_table(df, table_format, args.width, color_enabled)
 
-    # Show basic statistics
-    print(f"\nDataFrame Info:")
-    print(f"  Shape: {df.shape}")
-    print(f"  Columns: {list(df.columns)}")
-    print(f"  Data types: {df.dtypes.to_dict()}")
+    if df is not None:
+        # Show basic statistics
+        print(f"\nDataFrame Info:")
+        print(f"  Shape: {df.shape}")
+        print(f"  Columns: {list(df.columns)}")
+        if args.structure:
+            # Stringifying every dtype is O(columns); only pay for it when
+            # the user asked for structure details
+            print(f"  Data types:\n{df.dtypes.to_string()}")
 
     # Save to CSV if requested
     if args.output:
@@ -722,7 +1574,7 @@ def example_usage():
     }
 
     print("Example Usage:")
-    print("=" * 50)
+    print(_SEP_50)
 
     # Convert to DataFrame
     df = json_to_dataframe(sample_data)
@@ -733,6 +1585,7 @@ def example_usage():
     # Show hierarchical display
     print("\nHierarchical Display:")
     display_hierarchical_json(sample_data, "grid", 30, color_enabled=True)
+    clear_format_cache()
 
     # Show structure
     print("\nStructure Analysis:")
@@ -3,18 +3,58 @@
 Test script to demonstrate hierarchical JSON display
 """
 
-import json
-from json_converter import display_hierarchical_json, load_json_file
+import os
+import pickle
+import sys
 
-# Load the sample data
-data = load_json_file('data.json')
+from json_converter import (
+    flatten_hierarchical,
+    is_color_supported,
+    load_json_file,
+    render_hierarchical_view,
+)
 
-print("Testing Hierarchical Display:")
-print("=" * 60)
+DATA_FILE = 'data.json'
+# Flattened segments pickled across runs; rebuilt whenever the data file
+# is newer than the cache. The segments bake in whether color was
+# enabled when they were built, so that flag is stored alongside them
+# and a run with different color support rebuilds instead of replaying
+# ANSI codes into a pipe (or plain text onto a TTY).
+CACHE_FILE = f'.{DATA_FILE}.flat.pkl'
 
-# Test with grid format
-display_hierarchical_json(data, "grid", 50)
+def load_segments():
+    """Return the flattened segments, reusing the cache when it's fresh."""
+    color = is_color_supported()
+    mtime = os.path.getmtime(DATA_FILE)
+    try:
+        if os.path.getmtime(CACHE_FILE) > mtime:
+            with open(CACHE_FILE, 'rb') as f:
+                cached_color, segments = pickle.load(f)
+            if cached_color == color:
+                return segments
+    except Exception:
+        # A missing, truncated or otherwise unreadable cache (e.g. from an
+        # interrupted run) must never wedge the script; just rebuild
+        pass
+    segments = flatten_hierarchical(load_json_file(DATA_FILE), color_enabled=color)
+    with open(CACHE_FILE, 'wb') as f:
+        pickle.dump((color, segments), f, protocol=5)
+    return segments
 
-print("\n" + "=" * 60)
-print("Testing with ASCII format:")
-display_hierarchical_json(data, "plain", 50)
+if __name__ == "__main__":
+    # Walk the tree once (or load the pickled walk from a previous run);
+    # each format only pays for its own row formatting
+    segments = load_segments()
+    grid_out = render_hierarchical_view(segments, "grid", 50)
+    plain_out = render_hierarchical_view(segments, "plain", 50)
+
+    # Assemble headers and rendered trees into one buffered write instead
+    # of a print per line
+    sys.stdout.write(
+        "Testing Hierarchical Display:\n"
+        + "=" * 60 + "\n"
+        + grid_out
+        + "\n" + "=" * 60 + "\n"
+        + "Testing with ASCII format:\n"
+        + plain_out
+    )